@@ -9,7 +9,7 @@ import operator
 import psycopg2
 import re
 from ast import literal_eval
-from openerp.tools import mute_logger
+from openerp.tools import mute_logger, table_columns
 
 # Validation Library https://pypi.python.org/pypi/validate_email/1.1
 from .validate_email import validate_email
@@ -158,12 +158,7 @@ class MergePartnerAutomatic(osv.TransientModel):
                 continue
             partner_ids = tuple(map(int, src_partners))
 
-            query = "SELECT column_name FROM information_schema.columns WHERE table_name LIKE '%s'" % (table)
-            cr.execute(query, ())
-            columns = []
-            for data in cr.fetchall():
-                if data[0] != column:
-                    columns.append(data[0])
+            columns = [name for name in table_columns(cr, table) if name != column]
 
             query_dic = {
                 'table': table,
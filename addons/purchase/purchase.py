@@ -76,11 +76,7 @@ class purchase_order(osv.osv):
         for purchase in purchase_obj:
             res[purchase.id] = False
             if purchase.order_line:
-                min_date=purchase.order_line[0].date_planned
-                for line in purchase.order_line:
-                    if line.date_planned < min_date:
-                        min_date=line.date_planned
-                res[purchase.id]=min_date
+                res[purchase.id] = min(purchase.order_line.mapped('date_planned'))
         return res
 
 
@@ -939,9 +935,8 @@ class purchase_order(osv.osv):
             allorders.append(neworder_id)
 
             # make triggers pointing to the old orders point to the new order
-            for old_id in old_ids:
-                self.redirect_workflow(cr, uid, [(old_id, neworder_id)])
-                self.signal_workflow(cr, uid, [old_id], 'purchase_cancel')
+            self.redirect_workflow(cr, uid, [(old_id, neworder_id) for old_id in old_ids])
+            self.signal_workflow(cr, uid, old_ids, 'purchase_cancel')
 
         return orders_info
 
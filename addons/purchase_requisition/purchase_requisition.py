@@ -370,9 +370,13 @@ class purchase_order_line(osv.osv):
 
     def action_confirm(self, cr, uid, ids, context=None):
         super(purchase_order_line, self).action_confirm(cr, uid, ids, context=context)
-        for element in self.browse(cr, uid, ids, context=context):
-            if not element.quantity_bid:
-                self.write(cr, uid, ids, {'quantity_bid': element.product_qty}, context=context)
+        # group the lines without bid by quantity, to write them all at once
+        ids_per_qty = {}
+        for line in self.read(cr, uid, ids, ['product_qty', 'quantity_bid'], context=context):
+            if not line['quantity_bid']:
+                ids_per_qty.setdefault(line['product_qty'], []).append(line['id'])
+        for product_qty, line_ids in ids_per_qty.iteritems():
+            self.write(cr, uid, line_ids, {'quantity_bid': product_qty}, context=context)
         return True
 
     def generate_po(self, cr, uid, tender_id, context=None):
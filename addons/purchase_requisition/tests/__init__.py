@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+from . import test_purchase_order_line
+
+checks = [
+    test_purchase_order_line,
+]
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+from openerp.tests import common
+
+
+class TestPurchaseOrderLine(common.TransactionCase):
+
+    def setUp(self):
+        super(TestPurchaseOrderLine, self).setUp()
+        self.PurchaseOrderLine = self.registry('purchase.order.line')
+        self.order = self.browse_ref('purchase.purchase_order_1')
+
+    def test_confirm_keeps_bids(self):
+        """ Confirming lines keeps the existing bids and sets each line without
+            bid to its own quantity.
+        """
+        cr, uid = self.cr, self.uid
+        bid_line, line1, line2 = self.order.order_line[:3]
+        self.assertNotEqual(line1.product_qty, line2.product_qty)
+        self.PurchaseOrderLine.write(cr, uid, [bid_line.id], {'quantity_bid': 7.0})
+        self.PurchaseOrderLine.write(cr, uid, [line1.id, line2.id], {'quantity_bid': 0.0})
+
+        line_ids = [bid_line.id, line1.id, line2.id]
+        self.PurchaseOrderLine.action_confirm(cr, uid, line_ids)
+
+        lines = self.PurchaseOrderLine.browse(cr, uid, line_ids)
+        self.assertEqual(lines[0].quantity_bid, 7.0)
+        self.assertEqual(lines[1].quantity_bid, lines[1].product_qty)
+        self.assertEqual(lines[2].quantity_bid, lines[2].product_qty)
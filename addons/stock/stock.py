@@ -3372,7 +3372,7 @@ class stock_warehouse(osv.osv):
             # If single delivery we should create the necessary MTO rules for the resupply 
             # pulls = pull_obj.search(cr, uid, ['&', ('route_id', '=', mto_route_id), ('location_id.usage', '=', 'transit'), ('location_src_id', '=', warehouse.lot_stock_id.id)], context=context)
             pull_recs = pull_obj.browse(cr, uid, pulls, context=context)
-            transfer_locs = list(set([x.location_id for x in pull_recs]))
+            transfer_locs = pull_recs.mapped('location_id')
             vals = [(warehouse.lot_stock_id , x, warehouse.out_type_id.id) for x in transfer_locs]
             mto_pull_vals = self._get_mto_pull_rule(cr, uid, warehouse, vals, context=context)
             for mto_pull_val in mto_pull_vals:
@@ -318,15 +318,21 @@ class ir_model_fields(osv.osv):
     ]
 
     def _drop_column(self, cr, uid, ids, context=None):
-        for field in self.browse(cr, uid, ids, context):
-            if field.name in MAGIC_COLUMNS:
-                continue
+        to_drop = [field for field in self.browse(cr, uid, ids, context)
+                   if field.name not in MAGIC_COLUMNS]
+        if not to_drop:
+            return True
+
+        # look up the existing columns of ordinary tables in one go
+        pairs = [(self.pool[field.model]._table, field.name) for field in to_drop]
+        cr.execute("SELECT relname FROM pg_class WHERE relkind='r' AND relname IN %s",
+                   (tuple(set(table for table, _column in pairs)),))
+        tables = set(row[0] for row in cr.fetchall())
+        columns = tools.existing_columns(cr, [pair for pair in pairs if pair[0] in tables])
+
+        for field in to_drop:
             model = self.pool[field.model]
-            cr.execute('select relkind from pg_class where relname=%s', (model._table,))
-            result = cr.fetchone()
-            cr.execute("SELECT column_name FROM information_schema.columns WHERE table_name ='%s' and column_name='%s'" %(model._table, field.name))
-            column_name = cr.fetchone()
-            if column_name and (result and result[0] == 'r'):
+            if (model._table, field.name) in columns:
                 cr.execute('ALTER table "%s" DROP column "%s" cascade' % (model._table, field.name))
             # remove m2m relation table for custom fields
             # we consider the m2m relation is only one way as it's not possible
@@ -629,8 +635,7 @@ class ir_model_relation(Model):
                 # as installed modules have defined this element we must not delete it!
                 continue
 
-            cr.execute("SELECT 1 FROM information_schema.tables WHERE table_name=%s", (name,))
-            if cr.fetchone() and not name in to_drop_table:
+            if tools.table_exists(cr, name) and not name in to_drop_table:
                 to_drop_table.append(name)
 
         self.unlink(cr, uid, ids, context)
@@ -77,6 +77,45 @@ class TestORM(common.TransactionCase):
         with self.assertRaises(Exception):
             self.partner.unlink(cr, uid2, [p1,p2])
 
+    @mute_logger('openerp.models')
+    def testReplaceFilteredRelation(self):
+        """ Verify that replacing many2many links preserves the links to records filtered out for the user """
+        cr, uid, p2 = self.cr, self.uid, self.p2
+        category = self.registry('res.partner.category')
+        c1 = category.name_create(cr, uid, 'C1')[0]
+        c2 = category.name_create(cr, uid, 'C2')[0]
+        c3 = category.name_create(cr, uid, 'C3')[0]
+        self.partner.write(cr, uid, [p2], {'category_id': [(6, 0, [c1, c2])]})
+
+        category_model = self.registry('ir.model').search(cr, uid, [('model','=','res.partner.category')])[0]
+        self.ir_rule.create(cr, uid, {'name': 'C2 is invisible',
+                                      'domain_force': [('id', '!=', c2)],
+                                      'model_id': category_model})
+        manager_gids = [self.ref('base.group_user'), self.ref('base.group_partner_manager')]
+        uid3 = self.users.create(cr, uid, {'name': 'test manager', 'login': 'test_manager', 'groups_id': [(6, 0, manager_gids)]})
+
+        # the physical location of a link row changes if it is deleted and reinserted
+        rel, id1, id2 = self.partner._columns['category_id']._sql_names(self.partner)
+        def link_locations():
+            cr.execute('SELECT "%s", ctid FROM "%s" WHERE "%s"=%%s' % (id2, rel, id1), (p2,))
+            return dict(cr.fetchall())
+        locations = link_locations()
+
+        # replace the links as a user who cannot see C2
+        self.partner.write(cr, uid3, [p2], {'category_id': [(6, 0, [c1, c3])]})
+        self.assertItemsEqual([c1, c3], self.partner.read(cr, uid3, [p2], ['category_id'])[0]['category_id'])
+        self.assertItemsEqual([c1, c2, c3], self.partner.read(cr, uid, [p2], ['category_id'])[0]['category_id'],
+                              "the link to C2 should have been preserved")
+        new_locations = link_locations()
+        self.assertEqual(locations[c1], new_locations[c1], "the unchanged link to C1 should not have been rewritten")
+        self.assertEqual(locations[c2], new_locations[c2], "the hidden link to C2 should not have been rewritten")
+
+        # replacing with the hidden, already linked C2 and a duplicate id must
+        # not violate the unique constraint of the relation table
+        self.partner.write(cr, uid3, [p2], {'category_id': [(6, 0, [c1, c2, c3, c3])]})
+        self.assertItemsEqual([c1, c2, c3], self.partner.read(cr, uid, [p2], ['category_id'])[0]['category_id'])
+        self.assertEqual(new_locations, link_locations(), "unchanged links should not have been rewritten")
+
     def test_multi_read(self):
         record_id = self.partner.create(self.cr, UID, {'name': 'MyPartner1'})
         records = self.partner.read(self.cr, UID, [record_id])
@@ -32,6 +32,10 @@ class test_search(common.TransactionCase):
         self.assertEqual([a, ab, b, c], name_asc, "Search with 'NAME ASC' order failed.")
         name_desc = partners.search(cr, uid, [('name', 'like', 'test_search_order%')], order="name desc")
         self.assertEqual([c, b, ab, a], name_desc, "Search with 'NAME DESC' order failed.")
+        name_desc = partners.search(cr, uid, [('name', 'like', 'test_search_order%')], order="name  desc")
+        self.assertEqual([c, b, ab, a], name_desc, "Search with 'NAME  DESC' order failed.")
+        name_asc = partners.search(cr, uid, [('name', 'like', 'test_search_order%')], order="name,")
+        self.assertEqual([a, ab, b, c], name_asc, "Search with 'NAME,' order failed.")
         id_asc = partners.search(cr, uid, [('name', 'like', 'test_search_order%')], order="id asc")
         self.assertEqual([c, a, b, ab], id_asc, "Search with 'ID ASC' order failed.")
         id_desc = partners.search(cr, uid, [('name', 'like', 'test_search_order%')], order="id desc")
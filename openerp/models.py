@@ -2405,11 +2405,13 @@ class BaseModel(object):
                     # it's all good, nothing to do!
                     return
             else:
-                # Multiple FKs found for the same field, drop them all, and re-create
+                # Multiple FKs found for the same field, drop them all in a
+                # single statement, and re-create
+                cr.execute('ALTER TABLE "%s" %s' % (source_table, ', '.join(
+                    'DROP CONSTRAINT "%s"' % cons['constraint_name'] for cons in constraints)))
                 for cons in constraints:
-                    _schema.debug("Table '%s': dropping duplicate FK constraints: '%s'",
+                    _schema.debug("Table '%s': dropped duplicate FK constraints: '%s'",
                                   source_table, cons['constraint_name'])
-                    self._drop_constraint(cr, source_table, cons['constraint_name'])
 
         # (re-)create the FK
         self._m2o_add_foreign_key_checked(source_field, dest_model, ondelete)
@@ -2488,6 +2490,13 @@ class BaseModel(object):
             # iterate on the "object columns"
             column_data = self._select_column_data(cr)
 
+            # fetch the existing column indexes in one go, and create the
+            # missing ones in a single batch after the loop; the paths below
+            # that drop a column must discard its index from ``indexes``
+            index_name = lambda k: '%s_%s_index' % (self._table, k)
+            indexes = tools.existing_indexes(cr, map(index_name, self._columns))
+            indexes_to_create = []
+
             for k, f in self._columns.iteritems():
                 if k == 'id': # FIXME: maybe id should be a regular column?
                     continue
@@ -2527,6 +2536,7 @@ class BaseModel(object):
                             _logger.info('column %s (%s) converted to a function, removed from table %s',
                                          k, f.string, self._table)
                             cr.execute('ALTER TABLE "%s" DROP COLUMN "%s" CASCADE' % (self._table, k))
+                            indexes.discard(index_name(k))
                             cr.commit()
                             _schema.debug("Table '%s': dropped column '%s' with cascade",
                                 self._table, k)
@@ -2556,6 +2566,8 @@ class BaseModel(object):
                                     cr.execute('ALTER TABLE "%s" ADD COLUMN "%s" %s' % (self._table, k, pg_varchar(f.size)))
                                     cr.execute('UPDATE "%s" SET "%s"=temp_change_size::%s' % (self._table, k, pg_varchar(f.size)))
                                     cr.execute('ALTER TABLE "%s" DROP COLUMN temp_change_size CASCADE' % (self._table,))
+                                    # the index went away with the old column
+                                    indexes.discard(index_name(k))
                                 cr.commit()
                                 _schema.debug("Table '%s': column '%s' (type varchar) changed size from %s to %s",
                                     self._table, k, f_pg_size or 'unlimited', f.size or 'unlimited')
@@ -2567,6 +2579,7 @@ class BaseModel(object):
                                         cr.execute('ALTER TABLE "%s" ADD COLUMN "%s" %s' % (self._table, k, c[2]))
                                         cr.execute(('UPDATE "%s" SET "%s"= __temp_type_cast'+c[3]) % (self._table, k))
                                         cr.execute('ALTER TABLE "%s" DROP COLUMN  __temp_type_cast CASCADE' % (self._table,))
+                                        indexes.discard(index_name(k))
                                         cr.commit()
                                         _schema.debug("Table '%s': column '%s' changed type from %s to %s",
                                             self._table, k, c[0], c[1])
@@ -2577,11 +2590,7 @@ class BaseModel(object):
                                     i = 0
                                     while True:
                                         newname = k + '_moved' + str(i)
-                                        cr.execute("SELECT count(1) FROM pg_class c,pg_attribute a " \
-                                            "WHERE c.relname=%s " \
-                                            "AND a.attname=%s " \
-                                            "AND c.oid=a.attrelid ", (self._table, newname))
-                                        if not cr.fetchone()[0]:
+                                        if not tools.column_exists(cr, self._table, newname):
                                             break
                                         i += 1
                                     if f_pg_notnull:
@@ -2614,12 +2623,9 @@ class BaseModel(object):
                                 _schema.debug("Table '%s': column '%s': dropped NOT NULL constraint",
                                     self._table, k)
                             # Verify index
-                            indexname = '%s_%s_index' % (self._table, k)
-                            cr.execute("SELECT indexname FROM pg_indexes WHERE indexname = %s and tablename = %s", (indexname, self._table))
-                            res2 = cr.dictfetchall()
+                            res2 = index_name(k) in indexes
                             if not res2 and f.select:
-                                cr.execute('CREATE INDEX "%s_%s_index" ON "%s" ("%s")' % (self._table, k, self._table, k))
-                                cr.commit()
+                                indexes_to_create.append((index_name(k), self._table, k))
                                 if f._type == 'text':
                                     # FIXME: for fields.text columns we should try creating GIN indexes instead (seems most suitable for an ERP context)
                                     msg = "Table '%s': Adding (b-tree) index for %s column '%s'."\
@@ -2671,8 +2677,8 @@ class BaseModel(object):
                                 # ir_actions is inherited so foreign key doesn't work on it
                                 if dest_model._auto and ref != 'ir_actions':
                                     self._m2o_add_foreign_key_checked(k, dest_model, f.ondelete)
-                            if f.select:
-                                cr.execute('CREATE INDEX "%s_%s_index" ON "%s" ("%s")' % (self._table, k, self._table, k))
+                            if f.select and index_name(k) not in indexes:
+                                indexes_to_create.append((index_name(k), self._table, k))
                             if f.required:
                                 try:
                                     cr.commit()
@@ -2687,9 +2693,9 @@ class BaseModel(object):
                                     _logger.warning(msg, k, self._table, self._table, k, exc_info=True)
                             cr.commit()
 
-        else:
-            cr.execute("SELECT relname FROM pg_class WHERE relkind IN ('r','v') AND relname=%s", (self._table,))
-            create = not bool(cr.fetchone())
+            if indexes_to_create:
+                tools.create_indexes(cr, indexes_to_create, check=False)
+                cr.commit()
 
         cr.commit()     # start a new transaction
 
@@ -2728,8 +2734,7 @@ class BaseModel(object):
 
 
     def _table_exist(self, cr):
-        cr.execute("SELECT relname FROM pg_class WHERE relkind IN ('r','v') AND relname=%s", (self._table,))
-        return cr.rowcount
+        return tools.table_exists(cr, self._table)
 
 
     def _create_table(self, cr):
@@ -2739,11 +2744,7 @@ class BaseModel(object):
 
 
     def _parent_columns_exist(self, cr):
-        cr.execute("""SELECT c.relname
-            FROM pg_class c, pg_attribute a
-            WHERE c.relname=%s AND a.attname=%s AND c.oid=a.attrelid
-            """, (self._table, 'parent_left'))
-        return cr.rowcount
+        return tools.column_exists(cr, self._table, 'parent_left')
 
 
     def _create_parent_columns(self, cr):
@@ -2773,15 +2774,7 @@ class BaseModel(object):
 
 
     def _select_column_data(self, cr):
-        # attlen is the number of bytes necessary to represent the type when
-        # the type has a fixed size. If the type has a varying size attlen is
-        # -1 and atttypmod is the size limit + 4, or -1 if there is no limit.
-        cr.execute("SELECT c.relname,a.attname,a.attlen,a.atttypmod,a.attnotnull,a.atthasdef,t.typname,CASE WHEN a.attlen=-1 THEN (CASE WHEN a.atttypmod=-1 THEN 0 ELSE a.atttypmod-4 END) ELSE a.attlen END as size " \
-           "FROM pg_class c,pg_attribute a,pg_type t " \
-           "WHERE c.relname=%s " \
-           "AND c.oid=a.attrelid " \
-           "AND a.atttypid=t.oid", (self._table,))
-        return dict(map(lambda x: (x['attname'], x),cr.dictfetchall()))
+        return tools.table_columns(cr, self._table)
 
 
     def _o2m_raise_on_missing_reference(self, cr, f):
@@ -2800,8 +2793,7 @@ class BaseModel(object):
         # table name for custom relation all starts with x_, see __init__
         if not m2m_tbl.startswith('x_'):
             self._save_relation_table(cr, m2m_tbl)
-        cr.execute("SELECT relname FROM pg_class WHERE relkind IN ('r','v') AND relname=%s", (m2m_tbl,))
-        if not cr.dictfetchall():
+        if not tools.table_exists(cr, m2m_tbl):
             if f._obj not in self.pool:
                 raise except_orm('Programming Error', 'Many2Many destination model does not exist: `%s`' % (f._obj,))
             dest_model = self.pool[f._obj]
@@ -4479,9 +4471,11 @@ class BaseModel(object):
             order_by_elements = []
             self._check_qorder(order_spec)
             for order_part in order_spec.split(','):
-                order_split = order_part.strip().split(' ')
-                order_field = order_split[0].strip()
-                order_direction = order_split[1].strip() if len(order_split) == 2 else ''
+                order_split = order_part.split()
+                if not order_split:
+                    continue
+                order_field = order_split[0]
+                order_direction = order_split[1] if len(order_split) > 1 else ''
                 order_column = None
                 inner_clause = None
                 if order_field == 'id':
@@ -198,7 +198,7 @@ class Registry(Mapping):
         # must be reloaded.
         # The `base_cache_signaling sequence` indicates all caches must be
         # invalidated (i.e. cleared).
-        cr.execute("""SELECT sequence_name FROM information_schema.sequences WHERE sequence_name='base_registry_signaling'""")
+        cr.execute("""SELECT relname FROM pg_class WHERE relkind='S' AND relname='base_registry_signaling'""")
         if not cr.fetchall():
             cr.execute("""CREATE SEQUENCE base_registry_signaling INCREMENT BY 1 START WITH 1""")
             cr.execute("""SELECT nextval('base_registry_signaling')""")
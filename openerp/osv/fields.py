@@ -974,10 +974,20 @@ class many2many(_column):
                     d1 = ' and ' + ' and '.join(d1)
                 else:
                     d1 = ''
-                cr.execute('delete from '+rel+' where '+id1+'=%s AND '+id2+' IN (SELECT '+rel+'.'+id2+' FROM '+rel+', '+','.join(tables)+' WHERE '+rel+'.'+id1+'=%s AND '+rel+'.'+id2+' = '+obj._table+'.id '+ d1 +')', [id, id]+d2)
-
-                for act_nbr in act[2]:
-                    cr.execute('insert into '+rel+' ('+id1+','+id2+') values (%s, %s)', (id, act_nbr))
+                # fetch the current links, with whether the user may see the
+                # linked record; the links the user cannot see are preserved
+                cr.execute('SELECT '+rel+'.'+id2+', EXISTS (SELECT 1 FROM '+','.join(tables)+' WHERE '+obj._table+'.id = '+rel+'.'+id2+' '+ d1 +') FROM '+rel+' WHERE '+rel+'.'+id1+'=%s', d2+[id])
+                current = dict(cr.fetchall())
+
+                # only remove and insert the difference
+                new_ids = set(act[2])
+                to_remove = [rid for rid, visible in current.iteritems() if visible and rid not in new_ids]
+                to_insert = [rid for rid in new_ids if rid not in current]
+                if to_remove:
+                    cr.execute('delete from '+rel+' where '+id1+'=%s AND '+id2+' IN %s', (id, tuple(to_remove)))
+                if to_insert:
+                    cr.execute('insert into '+rel+' ('+id1+','+id2+') values '+','.join(['(%s, %s)'] * len(to_insert)),
+                               [val for rid in to_insert for val in (id, rid)])
 
     #
     # TODO: use a name_search
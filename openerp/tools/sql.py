@@ -19,8 +19,80 @@
 #
 ##############################################################################
 
+def existing_tables(cr, tablenames):
+    """ Return the names of existing tables or views among ``tablenames``. """
+    if not tablenames:
+        return []
+    cr.execute("SELECT relname FROM pg_class WHERE relkind IN ('r','v') AND relname IN %s",
+               (tuple(tablenames),))
+    return [row[0] for row in cr.fetchall()]
+
+def table_exists(cr, tablename):
+    """ Return whether the given table or view exists. """
+    return bool(existing_tables(cr, [tablename]))
+
+def existing_columns(cr, pairs):
+    """ Return the set of pairs ``(tablename, columnname)`` among ``pairs``
+        that correspond to existing columns.
+    """
+    if not pairs:
+        return set()
+    # avoid information_schema, its views are awfully slow
+    cr.execute("""SELECT c.relname, a.attname
+                  FROM pg_class c JOIN pg_attribute a ON (a.attrelid = c.oid)
+                  WHERE (c.relname, a.attname) IN %s
+                    AND a.attnum > 0 AND NOT a.attisdropped""",
+               (tuple(pairs),))
+    return set(cr.fetchall())
+
+def column_exists(cr, tablename, columnname):
+    """ Return whether the given column exists. """
+    return len(existing_columns(cr, [(tablename, columnname)])) == 1
+
+def table_columns(cr, tablename):
+    """ Return a dict mapping the names of the columns of the given table to
+        their catalog information: ``attname``, ``attlen``, ``atttypmod``,
+        ``attnotnull``, ``atthasdef``, ``typname`` and ``size``.
+    """
+    # attlen is the number of bytes necessary to represent the type when
+    # the type has a fixed size. If the type has a varying size attlen is
+    # -1 and atttypmod is the size limit + 4, or -1 if there is no limit.
+    cr.execute("SELECT c.relname,a.attname,a.attlen,a.atttypmod,a.attnotnull,a.atthasdef,t.typname,CASE WHEN a.attlen=-1 THEN (CASE WHEN a.atttypmod=-1 THEN 0 ELSE a.atttypmod-4 END) ELSE a.attlen END as size " \
+               "FROM pg_class c,pg_attribute a,pg_type t " \
+               "WHERE c.relname=%s " \
+               "AND c.oid=a.attrelid " \
+               "AND a.atttypid=t.oid " \
+               "AND a.attnum > 0 " \
+               "AND NOT a.attisdropped", (tablename,))
+    return dict((row['attname'], row) for row in cr.dictfetchall())
+
+def existing_indexes(cr, indexnames):
+    """ Return the set of existing indexes among ``indexnames``. """
+    if not indexnames:
+        return set()
+    cr.execute("SELECT relname FROM pg_class WHERE relkind='i' AND relname IN %s",
+               (tuple(indexnames),))
+    return set(row[0] for row in cr.fetchall())
+
+def create_indexes(cr, specs, check=True):
+    """ Create the missing indexes among ``specs``, a list of triples
+        ``(indexname, tablename, columnname)``, in a single query. Return the
+        list of the specs of the created indexes.
+
+        Pass ``check=False`` when the caller already knows that none of the
+        indexes exist.
+    """
+    if check:
+        existing = existing_indexes(cr, [spec[0] for spec in specs])
+        missing = [spec for spec in specs if spec[0] not in existing]
+    else:
+        missing = list(specs)
+    if missing:
+        cr.execute(';\n'.join('CREATE INDEX "%s" ON "%s" ("%s")' % spec for spec in missing))
+    return missing
+
 def drop_view_if_exists(cr, viewname):
-    cr.execute("DROP view IF EXISTS %s CASCADE" % (viewname,))
+    cr.execute('DROP view IF EXISTS "%s" CASCADE' % (viewname,))
     cr.commit()
 
 # vim:expandtab:smartindent:tabstop=4:softtabstop=4:shiftwidth=4:
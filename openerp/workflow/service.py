@@ -94,22 +94,20 @@ class WorkflowService(object):
         return result
 
     def redirect(self, new_rid):
-        # get ids of wkf instances for the old resource (res_id)
+        # redirect all workitems which "wait" for a wkf instance of the old
+        # resource (res_id) to the first active instance of the new resource
+        # (new_rid) using the same wkf
         # CHECKME: shouldn't we get only active instances?
-        self.cr.execute('select id, wkf_id from wkf_instance where res_id=%s and res_type=%s', (self.record.id, self.record.model))
-
-        for old_inst_id, workflow_id in self.cr.fetchall():
-            # first active instance for new resource (new_rid), using same wkf
-            self.cr.execute(
-                'SELECT id '\
-                'FROM wkf_instance '\
-                'WHERE res_id=%s AND res_type=%s AND wkf_id=%s AND state=%s',
-                (new_rid, self.record.model, workflow_id, 'active'))
-            new_id = self.cr.fetchone()
-            if new_id:
-                # select all workitems which "wait" for the old instance
-                self.cr.execute('select id from wkf_workitem where subflow_id=%s', (old_inst_id,))
-                for (item_id,) in self.cr.fetchall():
-                    # redirect all those workitems to the wkf instance of the new resource
-                    self.cr.execute('update wkf_workitem set subflow_id=%s where id=%s', (new_id[0], item_id))
+        self.cr.execute(
+            'UPDATE wkf_workitem w '\
+            'SET subflow_id=new_inst.id '\
+            'FROM wkf_instance old_inst, '\
+            '     (SELECT DISTINCT ON (wkf_id) id, wkf_id '\
+            '      FROM wkf_instance '\
+            '      WHERE res_id=%s AND res_type=%s AND state=%s '\
+            '      ORDER BY wkf_id, id) new_inst '\
+            'WHERE old_inst.res_id=%s AND old_inst.res_type=%s '\
+            'AND new_inst.wkf_id=old_inst.wkf_id '\
+            'AND w.subflow_id=old_inst.id',
+            (new_rid, self.record.model, 'active', self.record.id, self.record.model))
 